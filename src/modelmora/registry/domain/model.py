@@ -3,7 +3,7 @@ from typing import Annotated, Dict
 from pydantic import Field
 
 from modelmora.registry.domain.model_id import ModelId
-from modelmora.registry.domain.model_version import ModelVersion
+from modelmora.registry.domain.model_version import ModelVersion, semantic_version_key
 from modelmora.registry.domain.model_version_id import ModelVersionId
 from modelmora.registry.domain.task_type import TaskType
 from modelmora.shared import BaseEntity
@@ -51,14 +51,8 @@ class Model(BaseEntity):
         if not self.versions:
             raise ValueError("No versions available for this model.")
 
-        # Assuming version strings are in the format 'v{major}.{minor}.{patch}'
-        def version_key(mv: ModelVersion) -> tuple:
-            if not mv.value.startswith("v"):
-                return (float("-inf"),)  # Non-semantic versions are considered the oldest
-            parts = mv.value.lstrip("v").split(".")
-            return tuple(int(part) for part in parts)
-
-        latest_version = max(self.versions.values(), key=version_key)
+        # Non-semantic versions are considered the oldest
+        latest_version = max(self.versions.values(), key=lambda mv: semantic_version_key(mv.value))
         return latest_version
 
     def get_version_by_semantic(self, version_str: str) -> ModelVersion:
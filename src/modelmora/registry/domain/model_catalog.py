@@ -7,7 +7,7 @@ from modelmora.registry.domain.exceptions.model_already_exists_exception import
 from modelmora.registry.domain.exceptions.model_not_found_exception import ModelNotFoundException
 from modelmora.registry.domain.model import Model, ModelId
 from modelmora.registry.domain.model_catalog_id import ModelCatalogId
-from modelmora.registry.domain.model_version import ModelVersion
+from modelmora.registry.domain.model_version import ModelVersion, semantic_version_key
 from modelmora.shared import BaseAggregate
 from modelmora.shared.custom_types import ShortString
 
@@ -131,13 +131,16 @@ class ModelCatalog(BaseAggregate):
             search_text = filter_search_text.lower()
             models = [m for m in models if search_text in m.id.value.lower()]
 
+        # Versions are compared numerically (v10.0.0 > v9.0.0) through cached parsed keys
         filter_min_version = filter.get("min_version")
         if filter_min_version:
-            models = [m for m in models if any(mv.value >= filter_min_version for mv in m.versions.values())]
+            min_key = semantic_version_key(filter_min_version)
+            models = [m for m in models if any(semantic_version_key(mv.value) >= min_key for mv in m.versions.values())]
 
         filter_max_version = filter.get("max_version")
         if filter_max_version:
-            models = [m for m in models if any(mv.value <= filter_max_version for mv in m.versions.values())]
+            max_key = semantic_version_key(filter_max_version)
+            models = [m for m in models if any(semantic_version_key(mv.value) <= max_key for mv in m.versions.values())]
 
         return models
 
@@ -150,13 +153,10 @@ class ModelCatalog(BaseAggregate):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ModelCatalog):
             return NotImplemented
+        # The id check runs first, so catalogs with different ids are told apart without walking `models`
         return self.id == other.id and self.name == other.name and self.models == other.models
 
     def __hash__(self) -> int:
-        return hash(
-            (
-                self.id,
-                self.name,
-                frozenset(self.models.items()),
-            )
-        )
+        # Equal catalogs always share the id, so hashing it alone is consistent with __eq__; it also stays stable
+        # while models are registered, instead of re-hashing every model and version on each call.
+        return hash(self.id)
@@ -1,6 +1,6 @@
-from typing import Annotated
+from typing import Annotated, List
 
-from pydantic import Field, field_validator
+from pydantic import Field, TypeAdapter, field_validator
 
 from modelmora.shared import BaseValue
 
@@ -35,6 +35,20 @@ class ModelId(BaseValue):
         """Returns the repository part of the ModelId."""
         return self.value.split("/", 1)[1]
 
+    @classmethod
+    def from_strings(cls, values: List[str]) -> List["ModelId"]:
+        """Create a list of ModelId instances from a list of strings.
+
+        The whole list is validated in a single pydantic-core call, which is faster than constructing each
+        ModelId on its own when loading many models at once.
+
+        Args:
+            values (List[str]): A list of strings in the format {org}/{repo}.
+        Returns:
+            List[ModelId]: A list of ModelId instances.
+        """
+        return _MODEL_ID_LIST_ADAPTER.validate_python([{"value": value} for value in values])
+
     def __str__(self) -> str:
         return self.value
 
@@ -48,3 +62,6 @@ class ModelId(BaseValue):
 
     def __hash__(self) -> int:
         return hash(self.value)
+
+
+_MODEL_ID_LIST_ADAPTER = TypeAdapter(List[ModelId])
@@ -88,7 +88,7 @@ class ModelLock(BaseEntity):
         Returns:
             str: The YAML representation of the ModelLock entity.
         """
-        return yaml.dump(self.model_dump(mode="json"))
+        return yaml.dump(self.model_dump(mode="json"), Dumper=yaml.SafeDumper)
 
     def __repr__(self) -> str:
         return (
@@ -1,6 +1,8 @@
-from typing import Annotated, Any, Dict, Optional
+import re
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Optional, Tuple
 
-from pydantic import AnyUrl, Field
+from pydantic import AnyUrl, BeforeValidator, Field
 
 from modelmora.registry.domain.checksum import Checksum
 from modelmora.registry.domain.framework_enum import FrameworkEnum
@@ -9,6 +11,37 @@ from modelmora.registry.domain.model_version_id import ModelVersionId
 from modelmora.registry.domain.resource_requirements import ResourceRequirements
 from modelmora.shared import BaseEntity
 
+_SEMANTIC_VERSION_PATTERN = re.compile(r"^v(\d+)\.(\d+)\.(\d+)$")
+
+
+@lru_cache(maxsize=4096)
+def semantic_version_key(value: str) -> Tuple[int, ...]:
+    """Returns a sort key that orders version strings numerically by (major, minor, patch).
+
+    Non-semantic versions (branch names) sort before every semantic version. Parsed keys are cached, since the
+    same version strings are compared repeatedly when listing and resolving models.
+
+    Examples:
+        >>> semantic_version_key("v10.2.0") > semantic_version_key("v9.12.3")
+        True
+        >>> semantic_version_key("development") < semantic_version_key("v0.0.1")
+        True
+    """
+    match = _SEMANTIC_VERSION_PATTERN.match(value)
+    if match is None:
+        return (-1,)
+    return tuple(int(part) for part in match.groups())
+
+
+@lru_cache(maxsize=1024)
+def _parse_artifact_uri(value: str) -> AnyUrl:
+    return AnyUrl(value)
+
+
+def _reuse_parsed_artifact_uri(value: Any) -> Any:
+    """Parses string URIs through a bounded cache; AnyUrl is immutable, so versions with the same URI can share it."""
+    return _parse_artifact_uri(value) if isinstance(value, str) else value
+
 
 class ModelVersion(BaseEntity):
     id: ModelVersionId = Field(
@@ -38,6 +71,7 @@ class ModelVersion(BaseEntity):
 
     artifact_uri: Annotated[
         AnyUrl,
+        BeforeValidator(_reuse_parsed_artifact_uri),
         Field(
             description="The URI where the model artifacts are stored.",
             examples=[
@@ -117,16 +151,6 @@ class ModelVersion(BaseEntity):
         )
 
     def __hash__(self) -> int:
-        return hash(
-            (
-                self.id,
-                self.model_id,
-                self.value,
-                self.checksum,
-                self.artifact_uri,
-                self.resource_requirements,
-                self.framework,
-                self.framework_version,
-                frozenset(self.metadata.items()) if self.metadata else None,
-            )
-        )
+        # Equal versions always share the immutable `id`, so hashing it alone is consistent with __eq__, stays stable
+        # when mutable fields such as `metadata` change, and reuses the hash CPython caches on the id string.
+        return hash(self.id)
@@ -1,4 +1,5 @@
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Callable, Dict, Union
 
 from pydantic import Field, model_serializer
 
@@ -6,6 +7,195 @@ from modelmora.registry.domain.schema import Schema
 from modelmora.registry.domain.task_type_enum import TaskTypeEnum
 from modelmora.shared import BaseValue
 
+# One builder per task type, so a getter only builds the schema it was asked for. Each call returns a fresh dict,
+# so callers may mutate what they get back without affecting any other caller.
+_INPUT_SCHEMA_BUILDERS: Dict[TaskTypeEnum, Callable[[], Schema]] = {
+    TaskTypeEnum.TXT2EMBED: lambda: {
+        "type": "object",
+        "properties": {
+            "text": {"type": "string"},
+        },
+        "required": ["text"],
+    },
+    TaskTypeEnum.TXT2TXT: lambda: {
+        "type": "object",
+        "properties": {
+            "prompt": {"type": "string"},
+            "max_tokens": {"type": "integer", "default": 100},
+        },
+        "required": ["prompt"],
+    },
+    TaskTypeEnum.TXT2IMG: lambda: {
+        "type": "object",
+        "properties": {
+            "prompt": {"type": "string"},
+            "negative_prompt": {"type": "string"},
+            "width": {"type": "integer", "default": 512},
+            "height": {"type": "integer", "default": 512},
+        },
+        "required": ["prompt", "negative_prompt"],
+    },
+    TaskTypeEnum.IMG2TXT: lambda: {
+        "type": "object",
+        "properties": {
+            "image": {"type": "string"},
+        },
+        "required": ["image"],
+    },
+    TaskTypeEnum.IMG2IMG: lambda: {
+        "type": "object",
+        "properties": {
+            "image": {"type": "string"},
+            "prompt": {"type": "string"},
+            "negative_prompt": {"type": "string"},
+            "strength": {"type": "number", "default": 0.8},
+            "width": {"type": "integer", "default": 512},
+            "height": {"type": "integer", "default": 512},
+        },
+        "required": ["image", "prompt", "negative_prompt"],
+    },
+    TaskTypeEnum.AUDIO2TXT: lambda: {
+        "type": "object",
+        "properties": {
+            "audio": {"type": "string"},
+            "language": {"type": "string"},
+        },
+        "required": ["audio"],
+    },
+    TaskTypeEnum.TXT2AUDIO: lambda: {
+        "type": "object",
+        "properties": {
+            "text": {"type": "string"},
+            "voice": {"type": "string"},
+            "speed": {"type": "number", "default": 1.0},
+        },
+        "required": ["text"],
+    },
+    TaskTypeEnum.CLASSIFICATION: lambda: {
+        "type": "object",
+        "properties": {
+            "input": {"type": "string"},
+            "labels": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["input"],
+    },
+    TaskTypeEnum.OBJECT_DETECTION: lambda: {
+        "type": "object",
+        "properties": {
+            "image": {"type": "string"},
+            "confidence_threshold": {"type": "number", "default": 0.5},
+        },
+        "required": ["image"],
+    },
+    TaskTypeEnum.QUESTION_ANSWERING: lambda: {
+        "type": "object",
+        "properties": {
+            "question": {"type": "string"},
+            "context": {"type": "string"},
+        },
+        "required": ["question", "context"],
+    },
+}
+
+_OUTPUT_SCHEMA_BUILDERS: Dict[TaskTypeEnum, Callable[[], Schema]] = {
+    TaskTypeEnum.TXT2EMBED: lambda: {
+        "type": "object",
+        "properties": {
+            "embedding": {
+                "type": "array",
+                "items": {"type": "number"},
+            },
+        },
+    },
+    TaskTypeEnum.TXT2TXT: lambda: {
+        "type": "object",
+        "properties": {
+            "text": {"type": "string"},
+        },
+    },
+    TaskTypeEnum.TXT2IMG: lambda: {
+        "type": "object",
+        "properties": {
+            "image_uri": {"type": "string"},
+        },
+    },
+    TaskTypeEnum.IMG2TXT: lambda: {
+        "type": "object",
+        "properties": {
+            "text": {"type": "string"},
+        },
+    },
+    TaskTypeEnum.IMG2IMG: lambda: {
+        "type": "object",
+        "properties": {
+            "image_uri": {"type": "string"},
+        },
+    },
+    TaskTypeEnum.AUDIO2TXT: lambda: {
+        "type": "object",
+        "properties": {
+            "text": {"type": "string"},
+            "language": {"type": "string"},
+        },
+    },
+    TaskTypeEnum.TXT2AUDIO: lambda: {
+        "type": "object",
+        "properties": {
+            "audio_uri": {"type": "string"},
+        },
+    },
+    TaskTypeEnum.CLASSIFICATION: lambda: {
+        "type": "object",
+        "properties": {
+            "label": {"type": "string"},
+            "score": {"type": "number"},
+            "scores": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "label": {"type": "string"},
+                        "score": {"type": "number"},
+                    },
+                },
+            },
+        },
+    },
+    TaskTypeEnum.OBJECT_DETECTION: lambda: {
+        "type": "object",
+        "properties": {
+            "detections": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "label": {"type": "string"},
+                        "score": {"type": "number"},
+                        "bbox": {
+                            "type": "object",
+                            "properties": {
+                                "x": {"type": "number"},
+                                "y": {"type": "number"},
+                                "width": {"type": "number"},
+                                "height": {"type": "number"},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    TaskTypeEnum.QUESTION_ANSWERING: lambda: {
+        "type": "object",
+        "properties": {
+            "answer": {"type": "string"},
+            "score": {"type": "number"},
+            "start": {"type": "integer"},
+            "end": {"type": "integer"},
+        },
+    },
+}
+
 
 class TaskType(BaseValue):
     """Represents the type of task a model is designed to perform."""
@@ -17,6 +207,26 @@ class TaskType(BaseValue):
         ),
     ]
 
+    @classmethod
+    def of(cls, value: Union[TaskTypeEnum, str]) -> "TaskType":
+        """Return the shared TaskType instance for the given task type.
+
+        TaskType is a frozen value object with only a handful of possible values, so each one is validated once
+        and the same instance is returned on every later call. Invalid values are not cached and still raise.
+
+        Args:
+            value (Union[TaskTypeEnum, str]): The task type to return an instance for, as a member or its value.
+        Returns:
+            TaskType: The cached TaskType instance for the value.
+        """
+        try:
+            # Normalized first, since the cache keys on the argument type and would split "txt2txt" from the member
+            member = TaskTypeEnum(value)
+        except ValueError:
+            # Unknown task types go through validation so callers still get the usual ValidationError
+            return cls(value=value)
+        return _task_type_of(member)
+
     @model_serializer
     def serialize(self) -> str:
         return str(self.value)
@@ -36,194 +246,14 @@ class TaskType(BaseValue):
         return hash(self.value)
 
     def get_input_schema(self) -> Schema:
-        schemas = {
-            TaskTypeEnum.TXT2EMBED: {
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string"},
-                },
-                "required": ["text"],
-            },
-            TaskTypeEnum.TXT2TXT: {
-                "type": "object",
-                "properties": {
-                    "prompt": {"type": "string"},
-                    "max_tokens": {"type": "integer", "default": 100},
-                },
-                "required": ["prompt"],
-            },
-            TaskTypeEnum.TXT2IMG: {
-                "type": "object",
-                "properties": {
-                    "prompt": {"type": "string"},
-                    "negative_prompt": {"type": "string"},
-                    "width": {"type": "integer", "default": 512},
-                    "height": {"type": "integer", "default": 512},
-                },
-                "required": ["prompt", "negative_prompt"],
-            },
-            TaskTypeEnum.IMG2TXT: {
-                "type": "object",
-                "properties": {
-                    "image": {"type": "string"},
-                },
-                "required": ["image"],
-            },
-            TaskTypeEnum.IMG2IMG: {
-                "type": "object",
-                "properties": {
-                    "image": {"type": "string"},
-                    "prompt": {"type": "string"},
-                    "negative_prompt": {"type": "string"},
-                    "strength": {"type": "number", "default": 0.8},
-                    "width": {"type": "integer", "default": 512},
-                    "height": {"type": "integer", "default": 512},
-                },
-                "required": ["image", "prompt", "negative_prompt"],
-            },
-            TaskTypeEnum.AUDIO2TXT: {
-                "type": "object",
-                "properties": {
-                    "audio": {"type": "string"},
-                    "language": {"type": "string"},
-                },
-                "required": ["audio"],
-            },
-            TaskTypeEnum.TXT2AUDIO: {
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string"},
-                    "voice": {"type": "string"},
-                    "speed": {"type": "number", "default": 1.0},
-                },
-                "required": ["text"],
-            },
-            TaskTypeEnum.CLASSIFICATION: {
-                "type": "object",
-                "properties": {
-                    "input": {"type": "string"},
-                    "labels": {"type": "array", "items": {"type": "string"}},
-                },
-                "required": ["input"],
-            },
-            TaskTypeEnum.OBJECT_DETECTION: {
-                "type": "object",
-                "properties": {
-                    "image": {"type": "string"},
-                    "confidence_threshold": {"type": "number", "default": 0.5},
-                },
-                "required": ["image"],
-            },
-            TaskTypeEnum.QUESTION_ANSWERING: {
-                "type": "object",
-                "properties": {
-                    "question": {"type": "string"},
-                    "context": {"type": "string"},
-                },
-                "required": ["question", "context"],
-            },
-        }
-
-        return schemas[self.value]
+        """Returns a fresh copy of the JSON schema of the inputs a model of this task type accepts."""
+        return _INPUT_SCHEMA_BUILDERS[self.value]()
 
     def get_output_schema(self) -> Schema:
-        schemas = {
-            TaskTypeEnum.TXT2EMBED: {
-                "type": "object",
-                "properties": {
-                    "embedding": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                    },
-                },
-            },
-            TaskTypeEnum.TXT2TXT: {
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string"},
-                },
-            },
-            TaskTypeEnum.TXT2IMG: {
-                "type": "object",
-                "properties": {
-                    "image_uri": {"type": "string"},
-                },
-            },
-            TaskTypeEnum.IMG2TXT: {
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string"},
-                },
-            },
-            TaskTypeEnum.IMG2IMG: {
-                "type": "object",
-                "properties": {
-                    "image_uri": {"type": "string"},
-                },
-            },
-            TaskTypeEnum.AUDIO2TXT: {
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string"},
-                    "language": {"type": "string"},
-                },
-            },
-            TaskTypeEnum.TXT2AUDIO: {
-                "type": "object",
-                "properties": {
-                    "audio_uri": {"type": "string"},
-                },
-            },
-            TaskTypeEnum.CLASSIFICATION: {
-                "type": "object",
-                "properties": {
-                    "label": {"type": "string"},
-                    "score": {"type": "number"},
-                    "scores": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "label": {"type": "string"},
-                                "score": {"type": "number"},
-                            },
-                        },
-                    },
-                },
-            },
-            TaskTypeEnum.OBJECT_DETECTION: {
-                "type": "object",
-                "properties": {
-                    "detections": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "label": {"type": "string"},
-                                "score": {"type": "number"},
-                                "bbox": {
-                                    "type": "object",
-                                    "properties": {
-                                        "x": {"type": "number"},
-                                        "y": {"type": "number"},
-                                        "width": {"type": "number"},
-                                        "height": {"type": "number"},
-                                    },
-                                },
-                            },
-                        },
-                    },
-                },
-            },
-            TaskTypeEnum.QUESTION_ANSWERING: {
-                "type": "object",
-                "properties": {
-                    "answer": {"type": "string"},
-                    "score": {"type": "number"},
-                    "start": {"type": "integer"},
-                    "end": {"type": "integer"},
-                },
-            },
-        }
+        """Returns a fresh copy of the JSON schema of the outputs a model of this task type produces."""
+        return _OUTPUT_SCHEMA_BUILDERS[self.value]()
+
 
-        return schemas[self.value]
+@lru_cache(maxsize=None)
+def _task_type_of(value: TaskTypeEnum) -> TaskType:
+    return TaskType(value=value)
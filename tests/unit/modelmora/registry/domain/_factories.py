@@ -0,0 +1,90 @@
+"""Shared literals and validation-free builders for registry domain test data.
+
+The builders use `model_construct`, so they must only be fed trusted, known-valid literals. Enum-backed fields are
+stored as their raw values to match what `use_enum_values=True` produces on validated instances.
+"""
+
+from typing import Any, Dict
+
+from pydantic import AnyUrl
+
+from modelmora.registry.domain.framework_enum import FrameworkEnum
+from modelmora.registry.domain.locked_model_entry import LockedModelEntry
+from modelmora.registry.domain.model import Model
+from modelmora.registry.domain.model_id import ModelId
+from modelmora.registry.domain.model_version import ModelVersion
+from modelmora.registry.domain.resource_requirements import ResourceRequirements
+from modelmora.registry.domain.task_type import TaskType
+from modelmora.registry.domain.task_type_enum import TaskTypeEnum
+
+# Every value object below is frozen, so each one is validated once at import and shared by every test.
+SHA_A = "sha256:" + "a" * 64
+SHA_B = "sha256:" + "b" * 64
+SHA_C = "sha256:" + "c" * 64
+
+GPT4_ID = ModelId(value="openai/gpt-4")
+CLAUDE_ID = ModelId(value="anthropic/claude")
+
+MODEL_ARTIFACT_URI = AnyUrl("https://example.com/model.tar.gz")
+MODEL2_ARTIFACT_URI = AnyUrl("https://example.com/model2.tar.gz")
+OTHER_ARTIFACT_URI = AnyUrl("https://example.com/other.tar.gz")
+
+BASE_RESOURCE_REQUIREMENTS = ResourceRequirements(
+    memory_mb=1024,
+    gpu_vram_mb=2048,
+    cpu_threads=4,
+    gpu_count=1,
+    min_memory_mb=512,
+    disk_space_mb=5000,
+)
+LARGE_RESOURCE_REQUIREMENTS = ResourceRequirements(
+    memory_mb=2048,
+    gpu_vram_mb=4096,
+    cpu_threads=8,
+    gpu_count=2,
+    min_memory_mb=1024,
+    disk_space_mb=10000,
+)
+
+
+def make_version(**overrides: Any) -> ModelVersion:
+    """Build a ModelVersion without validation; `id` still comes from the field's default factory."""
+    fields: Dict[str, Any] = {
+        "model_id": GPT4_ID,
+        "value": "v1.0.0",
+        "checksum": SHA_A,
+        "artifact_uri": MODEL_ARTIFACT_URI,
+        "resource_requirements": BASE_RESOURCE_REQUIREMENTS,
+        "framework": FrameworkEnum.PYTORCH.value,
+    }
+    fields.update(overrides)
+    return ModelVersion.model_construct(**fields)
+
+
+def make_locked_entry(**overrides: Any) -> LockedModelEntry:
+    """Build a LockedModelEntry without validation, pinning `openai/gpt-4` at v1.0.0 by default."""
+    fields: Dict[str, Any] = {
+        "model_id": GPT4_ID,
+        "model_version": "v1.0.0",
+        "checksum": SHA_A,
+        "artifact_uri": MODEL_ARTIFACT_URI,
+        "resource_requirements": BASE_RESOURCE_REQUIREMENTS,
+    }
+    fields.update(overrides)
+    return LockedModelEntry.model_construct(**fields)
+
+
+def make_model(**overrides: Any) -> Model:
+    """Build a Model without validation; unless `versions` is given, it gets a single default version."""
+    model_id = overrides.pop("id", GPT4_ID)
+    versions = overrides.pop("versions", None)
+    if versions is None:
+        version = make_version(model_id=model_id)
+        versions = {version.id: version}
+    fields: Dict[str, Any] = {
+        "id": model_id,
+        "task_type": TaskType.model_construct(value=TaskTypeEnum.TXT2TXT.value),
+        "versions": versions,
+    }
+    fields.update(overrides)
+    return Model.model_construct(**fields)
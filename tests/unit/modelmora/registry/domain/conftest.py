@@ -0,0 +1,130 @@
+from typing import Any, Callable, Dict, Tuple
+
+import pytest
+
+from modelmora.registry.domain.framework_enum import FrameworkEnum
+from modelmora.registry.domain.locked_model_entry import LockedModelEntry
+from modelmora.registry.domain.model import Model
+from modelmora.registry.domain.model_version import ModelVersion
+from modelmora.registry.domain.resource_requirements import ResourceRequirements
+from modelmora.registry.domain.task_type import TaskType
+from modelmora.registry.domain.task_type_enum import TaskTypeEnum
+from tests.unit.modelmora.registry.domain._factories import (
+    BASE_RESOURCE_REQUIREMENTS,
+    CLAUDE_ID,
+    GPT4_ID,
+    LARGE_RESOURCE_REQUIREMENTS,
+    MODEL2_ARTIFACT_URI,
+    MODEL_ARTIFACT_URI,
+    OTHER_ARTIFACT_URI,
+    SHA_A,
+    SHA_B,
+    make_locked_entry,
+    make_version,
+)
+
+
+@pytest.fixture(scope="session")
+def base_resource_requirements() -> ResourceRequirements:
+    """Shared resource requirements; ResourceRequirements is frozen, so one instance serves the whole session."""
+    return BASE_RESOURCE_REQUIREMENTS
+
+
+@pytest.fixture(scope="module")
+def build_version(base_resource_requirements: ResourceRequirements) -> Callable[..., ModelVersion]:
+    """Builds validated `openai/gpt-4` versions; keyword overrides replace the canonical field values."""
+
+    def build(**overrides: Any) -> ModelVersion:
+        fields: Dict[str, Any] = {
+            "model_id": GPT4_ID,
+            "value": "v1.0.0",
+            "checksum": SHA_A,
+            "artifact_uri": MODEL_ARTIFACT_URI,
+            "resource_requirements": base_resource_requirements,
+            "framework": FrameworkEnum.PYTORCH,
+        }
+        fields.update(overrides)
+        return ModelVersion(**fields)
+
+    return build
+
+
+@pytest.fixture(scope="module")
+def base_version_v1(build_version: Callable[..., ModelVersion]) -> ModelVersion:
+    return build_version()
+
+
+@pytest.fixture(scope="session")
+def task_types() -> Dict[TaskTypeEnum, TaskType]:
+    """One TaskType per enum member; TaskType is frozen, so the instances are shared by the whole session."""
+    return {task_type_enum: TaskType.of(task_type_enum) for task_type_enum in TaskTypeEnum}
+
+
+@pytest.fixture(scope="module")
+def single_version_model(base_version_v1: ModelVersion, task_types: Dict[TaskTypeEnum, TaskType]) -> Model:
+    """Single-version `openai/gpt-4` model shared by read-only tests; tests must not mutate it."""
+    return Model(
+        id=GPT4_ID,
+        task_type=task_types[TaskTypeEnum.TXT2TXT],
+        versions={base_version_v1.id: base_version_v1},
+    )
+
+
+@pytest.fixture(scope="session")
+def large_resource_requirements() -> ResourceRequirements:
+    return LARGE_RESOURCE_REQUIREMENTS
+
+
+@pytest.fixture(scope="module")
+def claude_model(large_resource_requirements: ResourceRequirements, task_types: Dict[TaskTypeEnum, TaskType]) -> Model:
+    """Read-only `anthropic/claude` txt2img model at v2.0.0."""
+    version = ModelVersion(
+        model_id=CLAUDE_ID,
+        value="v2.0.0",
+        checksum=SHA_B,
+        artifact_uri=MODEL2_ARTIFACT_URI,
+        resource_requirements=large_resource_requirements,
+        framework=FrameworkEnum.PYTORCH,
+    )
+    return Model(
+        id=CLAUDE_ID,
+        task_type=task_types[TaskTypeEnum.TXT2IMG],
+        versions={version.id: version},
+    )
+
+
+@pytest.fixture(scope="module")
+def version_pair(large_resource_requirements: ResourceRequirements) -> Tuple[ModelVersion, ModelVersion]:
+    """Two read-only versions that differ in every field; tests that mutate a version build their own."""
+    return make_version(), make_version(
+        value="v2.0.0",
+        checksum=SHA_B,
+        artifact_uri=OTHER_ARTIFACT_URI,
+        resource_requirements=large_resource_requirements,
+    )
+
+
+def _checked_locked_entry(entry: LockedModelEntry) -> LockedModelEntry:
+    """Round-trip a `model_construct`-built entry through validation once, so literal drift still fails fast."""
+    assert LockedModelEntry.model_validate(entry.model_dump()) == entry
+    return entry
+
+
+@pytest.fixture(scope="session")
+def gpt4_locked_entry() -> LockedModelEntry:
+    """`openai/gpt-4` pinned at v1.0.0; LockedModelEntry is frozen, so one instance serves the whole session."""
+    return _checked_locked_entry(make_locked_entry())
+
+
+@pytest.fixture(scope="session")
+def claude_locked_entry(large_resource_requirements: ResourceRequirements) -> LockedModelEntry:
+    """`anthropic/claude` pinned at v2.0.0 with the large resource requirements."""
+    return _checked_locked_entry(
+        make_locked_entry(
+            model_id=CLAUDE_ID,
+            model_version="v2.0.0",
+            checksum=SHA_B,
+            artifact_uri=MODEL2_ARTIFACT_URI,
+            resource_requirements=large_resource_requirements,
+        )
+    )
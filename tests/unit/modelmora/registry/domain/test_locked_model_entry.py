@@ -1,126 +1,99 @@
 import pytest
-from pydantic import AnyUrl, ValidationError
+from pydantic import ValidationError
 
 from modelmora.registry.domain.locked_model_entry import LockedModelEntry
-from modelmora.registry.domain.model_id import ModelId
 from modelmora.registry.domain.resource_requirements import ResourceRequirements
+from tests.unit.modelmora.registry.domain._factories import (
+    CLAUDE_ID,
+    GPT4_ID,
+    MODEL_ARTIFACT_URI,
+    OTHER_ARTIFACT_URI,
+    SHA_A,
+    SHA_B,
+    SHA_C,
+)
 
 
 class TestLockedModelEntryInitialization:
     """Test LockedModelEntry initialization and validation."""
 
     def test_create_locked_model_entry_with_valid_values_should_succeed(
-        self,
+        self, base_resource_requirements: ResourceRequirements
     ) -> None:
         # Arrange & Act
         entry = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_A,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
 
         # Assert
         assert entry.model_id.value == "openai/gpt-4"
         assert entry.model_version == "v1.0.0"
-        assert entry.checksum == "sha256:" + "a" * 64
+        assert entry.checksum == SHA_A
         assert str(entry.artifact_uri) == "https://example.com/model.tar.gz"
         assert entry.resource_requirements.memory_mb == 1024
 
     def test_create_locked_model_entry_with_development_version_should_succeed(
-        self,
+        self, base_resource_requirements: ResourceRequirements
     ) -> None:
         # Arrange & Act
         entry = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="development",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_B,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
 
         # Assert
         assert entry.model_version == "development"
 
     def test_create_locked_model_entry_with_feature_branch_version_should_succeed(
-        self,
+        self, base_resource_requirements: ResourceRequirements
     ) -> None:
         # Arrange & Act
         entry = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="feature-xyz",
-            checksum="sha256:" + "c" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_C,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
 
         # Assert
         assert entry.model_version == "feature-xyz"
 
     def test_create_locked_model_entry_with_invalid_checksum_format_should_raise_error(
-        self,
+        self, base_resource_requirements: ResourceRequirements
     ) -> None:
         # Arrange & Act & Assert
         with pytest.raises(ValidationError):
             LockedModelEntry(
-                model_id=ModelId(value="openai/gpt-4"),
+                model_id=GPT4_ID,
                 model_version="v1.0.0",
                 checksum="invalid_checksum",
-                artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-                resource_requirements=ResourceRequirements(
-                    memory_mb=1024,
-                    gpu_vram_mb=2048,
-                    cpu_threads=4,
-                    gpu_count=1,
-                    min_memory_mb=512,
-                    disk_space_mb=5000,
-                ),
+                artifact_uri=MODEL_ARTIFACT_URI,
+                resource_requirements=base_resource_requirements,
             )
 
     def test_create_locked_model_entry_with_invalid_version_pattern_should_raise_error(
-        self,
+        self, base_resource_requirements: ResourceRequirements
     ) -> None:
         # Arrange & Act & Assert
         with pytest.raises(ValidationError):
             LockedModelEntry(
-                model_id=ModelId(value="openai/gpt-4"),
+                model_id=GPT4_ID,
                 model_version="invalid version!",
-                checksum="sha256:" + "a" * 64,
-                artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-                resource_requirements=ResourceRequirements(
-                    memory_mb=1024,
-                    gpu_vram_mb=2048,
-                    cpu_threads=4,
-                    gpu_count=1,
-                    min_memory_mb=512,
-                    disk_space_mb=5000,
-                ),
+                checksum=SHA_A,
+                artifact_uri=MODEL_ARTIFACT_URI,
+                resource_requirements=base_resource_requirements,
             )
 
     def test_create_locked_model_entry_with_version_exceeding_max_length_should_raise_error(
-        self,
+        self, base_resource_requirements: ResourceRequirements
     ) -> None:
         # Arrange
         long_version = "v" + "1" * 150
@@ -128,39 +101,25 @@ class TestLockedModelEntryInitialization:
         # Act & Assert
         with pytest.raises(ValidationError):
             LockedModelEntry(
-                model_id=ModelId(value="openai/gpt-4"),
+                model_id=GPT4_ID,
                 model_version=long_version,
-                checksum="sha256:" + "a" * 64,
-                artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-                resource_requirements=ResourceRequirements(
-                    memory_mb=1024,
-                    gpu_vram_mb=2048,
-                    cpu_threads=4,
-                    gpu_count=1,
-                    min_memory_mb=512,
-                    disk_space_mb=5000,
-                ),
+                checksum=SHA_A,
+                artifact_uri=MODEL_ARTIFACT_URI,
+                resource_requirements=base_resource_requirements,
             )
 
 
 class TestLockedModelEntryStringRepresentations:
     """Test LockedModelEntry string representations."""
 
-    def test_repr_should_return_detailed_string(self) -> None:
+    def test_repr_should_return_detailed_string(self, base_resource_requirements: ResourceRequirements) -> None:
         # Arrange
         entry = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_A,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
 
         # Act
@@ -174,21 +133,14 @@ class TestLockedModelEntryStringRepresentations:
         assert "artifact_uri" in result
         assert "resource_requirements" in result
 
-    def test_str_should_return_readable_string(self) -> None:
+    def test_str_should_return_readable_string(self, base_resource_requirements: ResourceRequirements) -> None:
         # Arrange
         entry = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_A,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
 
         # Act
@@ -204,92 +156,59 @@ class TestLockedModelEntryEquality:
     """Test LockedModelEntry equality and hashing."""
 
     def test_equal_locked_model_entries_with_same_values_should_be_equal(
-        self,
+        self, base_resource_requirements: ResourceRequirements
     ) -> None:
         # Arrange
         entry1 = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_A,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
         entry2 = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_A,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
 
         # Act & Assert
         assert entry1 == entry2
 
-    def test_different_locked_model_entries_should_not_be_equal(self) -> None:
+    def test_different_locked_model_entries_should_not_be_equal(
+        self, base_resource_requirements: ResourceRequirements, large_resource_requirements: ResourceRequirements
+    ) -> None:
         # Arrange
         entry1 = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_A,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
         entry2 = LockedModelEntry(
-            model_id=ModelId(value="anthropic/claude"),
+            model_id=CLAUDE_ID,
             model_version="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/other.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
+            checksum=SHA_B,
+            artifact_uri=OTHER_ARTIFACT_URI,
+            resource_requirements=large_resource_requirements,
         )
 
         # Act & Assert
         assert entry1 != entry2
 
     def test_locked_model_entry_equality_with_non_entry_should_return_not_implemented(
-        self,
+        self, base_resource_requirements: ResourceRequirements
     ) -> None:
         # Arrange
         entry = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_A,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
 
         # Act
@@ -298,35 +217,23 @@ class TestLockedModelEntryEquality:
         # Assert
         assert result == NotImplemented
 
-    def test_equal_locked_model_entries_should_have_equal_hashes(self) -> None:
+    def test_equal_locked_model_entries_should_have_equal_hashes(
+        self, base_resource_requirements: ResourceRequirements
+    ) -> None:
         # Arrange
         entry1 = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_A,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
         entry2 = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_A,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
 
         # Act & Assert
@@ -336,21 +243,16 @@ class TestLockedModelEntryEquality:
 class TestLockedModelEntryImmutability:
     """Test LockedModelEntry immutability (frozen=True)."""
 
-    def test_modify_locked_model_entry_field_should_raise_error(self) -> None:
+    def test_modify_locked_model_entry_field_should_raise_error(
+        self, base_resource_requirements: ResourceRequirements
+    ) -> None:
         # Arrange
         entry = LockedModelEntry(
-            model_id=ModelId(value="openai/gpt-4"),
+            model_id=GPT4_ID,
             model_version="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
+            checksum=SHA_A,
+            artifact_uri=MODEL_ARTIFACT_URI,
+            resource_requirements=base_resource_requirements,
         )
 
         # Act & Assert
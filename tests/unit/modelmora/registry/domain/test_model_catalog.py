@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+from typing import Callable, FrozenSet, Iterable, Iterator, List, Optional, Type
+
 import pytest
 from pydantic import AnyUrl
 
@@ -15,11 +18,90 @@ from modelmora.registry.domain.exceptions.model_not_found_exception import (
 from modelmora.registry.domain.framework_enum import FrameworkEnum
 from modelmora.registry.domain.model import Model
 from modelmora.registry.domain.model_catalog import ModelCatalog, ModelFilter
+from modelmora.registry.domain.model_catalog_id import ModelCatalogId
 from modelmora.registry.domain.model_id import ModelId
 from modelmora.registry.domain.model_version import ModelVersion
+from modelmora.registry.domain.model_version_id import ModelVersionId
 from modelmora.registry.domain.resource_requirements import ResourceRequirements
 from modelmora.registry.domain.task_type import TaskType
 from modelmora.registry.domain.task_type_enum import TaskTypeEnum
+from modelmora.shared.events import DomainEvent
+from tests.unit.modelmora.registry.domain._factories import (
+    CLAUDE_ID,
+    GPT4_ID,
+    MODEL2_ARTIFACT_URI,
+    SHA_B,
+    SHA_C,
+    make_model,
+    make_version,
+)
+
+_URL_MODEL_V2 = AnyUrl("https://example.com/model-v2.tar.gz")
+_URL_MODEL_3 = AnyUrl("https://example.com/model3.tar.gz")
+
+# Enum members bound once at import so tests and parametrize tables don't repeat the class attribute lookups.
+_PYTORCH = FrameworkEnum.PYTORCH
+_PYTORCH_VAL = _PYTORCH.value
+_TXT2TXT = TaskTypeEnum.TXT2TXT
+_TXT2IMG = TaskTypeEnum.TXT2IMG
+
+# list_models filters; never mutated by the catalog, so one instance per filter is shared across tests.
+_F_TXT2TXT: ModelFilter = {"task_type": _TXT2TXT.value}
+_F_PYTORCH: ModelFilter = {"framework": _PYTORCH_VAL}
+_F_SEARCH_OPENAI: ModelFilter = {"search_text": "openai"}
+_F_MIN_V2: ModelFilter = {"min_version": "v2.0.0"}
+_F_MAX_V1_5: ModelFilter = {"max_version": "v1.5.0"}
+_F_MAX_V9: ModelFilter = {"max_version": "v9.0.0"}
+_F_GPT4_TXT2TXT_PYTORCH: ModelFilter = {"task_type": _TXT2TXT.value, "framework": _PYTORCH_VAL, "search_text": "gpt-4"}
+
+# Fixed version IDs: deterministic, and make_version skips the uuid4 default factory when one is given.
+_GPT4_V2_ID = ModelVersionId("00000000-0000-4000-8000-000000000001")
+_GPT3_V2_ID = ModelVersionId("00000000-0000-4000-8000-000000000002")
+_CLAUDE_V15_ID = ModelVersionId("00000000-0000-4000-8000-000000000003")
+_GPT4_V10_ID = ModelVersionId("00000000-0000-4000-8000-000000000004")
+
+
+# ModelId is a frozen value object, so one validated instance per ID is shared across tests.
+_GPT3_ID = ModelId(value="openai/gpt-3")
+_MISSING_ID = ModelId(value="missing/model")
+
+# Expected `model_id` event payload, rendered once from the shared ID.
+_GPT4_ID_STR = str(GPT4_ID)
+
+
+@contextmanager
+def _expect_events(catalog: ModelCatalog, types: List[Type[DomainEvent]]) -> Iterator[List[DomainEvent]]:
+    """Collect the events emitted inside the block and check their types, without clearing earlier events.
+
+    The yielded list is filled on exit, so inspect it after the `with` block.
+    """
+    start = len(catalog.events)
+    emitted: List[DomainEvent] = []
+    yield emitted
+    emitted.extend(catalog.events[start:])
+    assert [type(event) for event in emitted] == types
+
+
+def _ids(models: Iterable[Model]) -> FrozenSet[ModelId]:
+    """Compare listed models by their hashable IDs instead of deep Model equality."""
+    return frozenset(model.id for model in models)
+
+
+@pytest.fixture(scope="module")
+def populated_catalog(single_version_model: Model) -> ModelCatalog:
+    """Catalog holding only `openai/gpt-4`; shared by error-path tests, which all raise before mutating it."""
+    catalog = ModelCatalog(name="test-catalog")
+    catalog.register_model(single_version_model)
+    return catalog
+
+
+@pytest.fixture
+def catalog(populated_catalog: ModelCatalog) -> ModelCatalog:
+    """Per-test deep copy of `populated_catalog` for tests that mutate the catalog or its models.
+
+    Mutating tests never touch shared state, so they stay order-independent and safe to run under pytest-xdist.
+    """
+    return populated_catalog.model_copy(deep=True)
 
 
 class TestModelCatalogInitialization:
@@ -43,8 +125,8 @@ class TestModelCatalogInitialization:
         )
 
         # Assert
-        assert catalog.id is not None
-        assert len(str(catalog.id)) == 36  # UUID format
+        # ModelCatalogId only admits valid UUID strings, so the type check implies the format
+        assert isinstance(catalog.id, ModelCatalogId)
 
     def test_create_model_catalog_with_empty_models_should_succeed(self) -> None:
         # Arrange & Act
@@ -60,537 +142,225 @@ class TestModelCatalogInitialization:
 class TestModelCatalogRegisterModel:
     """Test ModelCatalog register_model method."""
 
-    def test_register_model_to_empty_catalog_should_succeed(self) -> None:
+    def test_register_model_to_empty_catalog_should_store_model_and_emit_event(
+        self,
+        single_version_model: Model,
+    ) -> None:
         # Arrange
         catalog = ModelCatalog(name="test-catalog")
-        model_id = ModelId(value="openai/gpt-4")
-        version = ModelVersion(
-            model_id=model_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model = Model(
-            id=model_id,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version.id: version},
-        )
 
         # Act
-        catalog.register_model(model)
+        with _expect_events(catalog, [ModelRegisteredEvent]) as events:
+            catalog.register_model(single_version_model)
 
         # Assert
         assert len(catalog.models) == 1
-        assert model_id in catalog.models
-        assert catalog.models[model_id] == model
+        # register_model stores the instance it is given, so identity is the precise check
+        assert catalog.models[single_version_model.id] is single_version_model
+        assert events[0].payload["model_id"] == _GPT4_ID_STR
 
-    def test_register_model_should_emit_event(self) -> None:
+    def test_register_multiple_models_should_succeed(self, single_version_model: Model, claude_model: Model) -> None:
         # Arrange
         catalog = ModelCatalog(name="test-catalog")
-        model_id = ModelId(value="openai/gpt-4")
-        version = ModelVersion(
-            model_id=model_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model = Model(
-            id=model_id,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version.id: version},
-        )
 
         # Act
-        catalog.register_model(model)
-
-        # Assert
-        assert len(catalog.events) == 1
-        event = catalog.events[0]
-        assert isinstance(event, ModelRegisteredEvent)
-        assert event.payload["model_id"] == str(model_id)
-
-    def test_register_multiple_models_should_succeed(self) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id1 = ModelId(value="openai/gpt-4")
-        version1 = ModelVersion(
-            model_id=model_id1,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model1.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model1 = Model(
-            id=model_id1,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version1.id: version1},
-        )
-
-        model_id2 = ModelId(value="anthropic/claude")
-        version2 = ModelVersion(
-            model_id=model_id2,
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model2.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model2 = Model(
-            id=model_id2,
-            task_type=TaskType(value=TaskTypeEnum.TXT2IMG),
-            versions={version2.id: version2},
-        )
-
-        # Act
-        catalog.register_model(model1)
-        catalog.register_model(model2)
+        catalog.register_model(single_version_model)
+        catalog.register_model(claude_model)
 
         # Assert
         assert len(catalog.models) == 2
-        assert model_id1 in catalog.models
-        assert model_id2 in catalog.models
+        assert single_version_model.id in catalog.models
+        assert claude_model.id in catalog.models
         assert len(catalog.events) == 2
 
-    def test_register_duplicate_model_should_raise_exception(self) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id = ModelId(value="openai/gpt-4")
-        version = ModelVersion(
-            model_id=model_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model = Model(
-            id=model_id,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version.id: version},
-        )
-        catalog.register_model(model)
-
-        # Act & Assert
-        with pytest.raises(ModelAlreadyExistsException):
-            catalog.register_model(model)
-
 
 class TestModelCatalogUnregisterModel:
     """Test ModelCatalog unregister_model method."""
 
-    def test_unregister_existing_model_should_succeed(self) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id = ModelId(value="openai/gpt-4")
-        version = ModelVersion(
-            model_id=model_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model = Model(
-            id=model_id,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version.id: version},
-        )
-        catalog.register_model(model)
-
+    def test_unregister_existing_model_should_remove_model_and_emit_event(
+        self,
+        catalog: ModelCatalog,
+        single_version_model: Model,
+    ) -> None:
         # Act
-        catalog.unregister_model(model_id)
+        with _expect_events(catalog, [ModelUnregisteredEvent]) as events:
+            catalog.unregister_model(single_version_model.id)
 
         # Assert
         assert len(catalog.models) == 0
-        assert model_id not in catalog.models
-
-    def test_unregister_model_should_emit_event(self) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id = ModelId(value="openai/gpt-4")
-        version = ModelVersion(
-            model_id=model_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model = Model(
-            id=model_id,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version.id: version},
-        )
-        catalog.register_model(model)
-        catalog.clear_events()  # Clear registration event
-
-        # Act
-        catalog.unregister_model(model_id)
-
-        # Assert
-        assert len(catalog.events) == 1
-        event = catalog.events[0]
-        assert isinstance(event, ModelUnregisteredEvent)
-        assert event.payload["model_id"] == str(model_id)
-
-    def test_unregister_non_existing_model_should_raise_exception(self) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        non_existing_id = ModelId(value="openai/gpt-4")
-
-        # Act & Assert
-        with pytest.raises(ModelNotFoundException):
-            catalog.unregister_model(non_existing_id)
+        assert single_version_model.id not in catalog.models
+        assert events[0].payload["model_id"] == _GPT4_ID_STR
 
     def test_unregister_from_multiple_models_should_remove_only_specified(
         self,
+        catalog: ModelCatalog,
+        single_version_model: Model,
+        claude_model: Model,
     ) -> None:
         # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id1 = ModelId(value="openai/gpt-4")
-        version1 = ModelVersion(
-            model_id=model_id1,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model1.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model1 = Model(
-            id=model_id1,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version1.id: version1},
-        )
-
-        model_id2 = ModelId(value="anthropic/claude")
-        version2 = ModelVersion(
-            model_id=model_id2,
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model2.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model2 = Model(
-            id=model_id2,
-            task_type=TaskType(value=TaskTypeEnum.TXT2IMG),
-            versions={version2.id: version2},
-        )
-        catalog.register_model(model1)
-        catalog.register_model(model2)
+        catalog.register_model(claude_model)
 
         # Act
-        catalog.unregister_model(model_id1)
+        catalog.unregister_model(single_version_model.id)
 
         # Assert
         assert len(catalog.models) == 1
-        assert model_id1 not in catalog.models
-        assert model_id2 in catalog.models
+        assert single_version_model.id not in catalog.models
+        assert claude_model.id in catalog.models
 
 
 class TestModelCatalogAddVersionToModel:
     """Test ModelCatalog add_version_to_model method."""
 
-    def test_add_version_to_existing_model_should_succeed(self) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id = ModelId(value="openai/gpt-4")
-        version1 = ModelVersion(
-            model_id=model_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model-v1.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model = Model(
-            id=model_id,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version1.id: version1},
-        )
-        catalog.register_model(model)
-
-        version2 = ModelVersion(
-            model_id=model_id,
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model-v2.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-
-        # Act
-        catalog.add_version_to_model(model_id, version2)
-
-        # Assert
-        assert len(catalog.models[model_id].versions) == 2
-        assert version2.id in catalog.models[model_id].versions
-
-    def test_add_version_to_model_should_emit_event(self) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id = ModelId(value="openai/gpt-4")
-        version1 = ModelVersion(
-            model_id=model_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model-v1.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model = Model(
-            id=model_id,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version1.id: version1},
-        )
-        catalog.register_model(model)
-        catalog.clear_events()  # Clear registration event
-
-        version2 = ModelVersion(
-            model_id=model_id,
+    @pytest.fixture
+    def version_v2(self, large_resource_requirements: ResourceRequirements) -> ModelVersion:
+        return make_version(
+            id=_GPT4_V2_ID,
             value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model-v2.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
+            checksum=SHA_B,
+            artifact_uri=_URL_MODEL_V2,
+            resource_requirements=large_resource_requirements,
         )
 
+    def test_add_version_to_existing_model_should_store_version_and_emit_event(
+        self,
+        catalog: ModelCatalog,
+        single_version_model: Model,
+        version_v2: ModelVersion,
+    ) -> None:
         # Act
-        catalog.add_version_to_model(model_id, version2)
+        with _expect_events(catalog, [ModelVersionAddedEvent]) as events:
+            catalog.add_version_to_model(single_version_model.id, version_v2)
 
         # Assert
-        assert len(catalog.events) == 1
-        event = catalog.events[0]
-        assert isinstance(event, ModelVersionAddedEvent)
-        assert event.payload["model_id"] == str(model_id)
-        assert event.payload["model_version_value"] == "v2.0.0"
-
-    def test_add_version_to_non_existing_model_should_raise_exception(self) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        non_existing_id = ModelId(value="openai/gpt-4")
-        version = ModelVersion(
-            model_id=non_existing_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-
-        # Act & Assert
-        with pytest.raises(ModelNotFoundException):
-            catalog.add_version_to_model(non_existing_id, version)
+        assert len(catalog.models[single_version_model.id].versions) == 2
+        assert version_v2.id in catalog.models[single_version_model.id].versions
+        # The shared model is untouched because the catalog holds a deep copy
+        assert len(single_version_model.versions) == 1
+        assert events[0].payload["model_id"] == _GPT4_ID_STR
+        assert events[0].payload["model_version_value"] == "v2.0.0"
 
 
 class TestModelCatalogGetModel:
     """Test ModelCatalog get_model method."""
 
-    def test_get_existing_model_should_return_model(self) -> None:
+    def test_get_existing_model_should_return_model(self, single_version_model: Model) -> None:
         # Arrange
         catalog = ModelCatalog(name="test-catalog")
-        model_id = ModelId(value="openai/gpt-4")
-        version = ModelVersion(
-            model_id=model_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model = Model(
-            id=model_id,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version.id: version},
-        )
-        catalog.register_model(model)
+        catalog.register_model(single_version_model)
 
         # Act
-        result = catalog.get_model(model_id)
+        result = catalog.get_model(single_version_model.id)
 
         # Assert
-        assert result == model
-        assert result.id == model_id
-
-    def test_get_non_existing_model_should_raise_exception(self) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        non_existing_id = ModelId(value="openai/gpt-4")
-
+        assert result is single_version_model
+        assert result.id == single_version_model.id
+
+
+class TestModelCatalogErrors:
+    """Test ModelCatalog error paths."""
+
+    @pytest.mark.parametrize(
+        "operation,expected_exception",
+        [
+            (lambda catalog, model: catalog.register_model(model), ModelAlreadyExistsException),
+            (lambda catalog, _: catalog.unregister_model(_MISSING_ID), ModelNotFoundException),
+            (
+                lambda catalog, model: catalog.add_version_to_model(_MISSING_ID, next(iter(model.versions.values()))),
+                ModelNotFoundException,
+            ),
+            (lambda catalog, _: catalog.get_model(_MISSING_ID), ModelNotFoundException),
+        ],
+        ids=["register_duplicate", "unregister_missing", "add_version_to_missing", "get_missing"],
+    )
+    def test_invalid_operation_should_raise_exception(
+        self,
+        populated_catalog: ModelCatalog,
+        single_version_model: Model,
+        operation: Callable[[ModelCatalog, Model], None],
+        expected_exception: Type[Exception],
+    ) -> None:
         # Act & Assert
-        with pytest.raises(ModelNotFoundException):
-            catalog.get_model(non_existing_id)
+        with pytest.raises(expected_exception):
+            operation(populated_catalog, single_version_model)
+
+
+@pytest.fixture(scope="module")
+def two_model_catalog(single_version_model: Model, claude_model: Model) -> ModelCatalog:
+    """Catalog with `openai/gpt-4` (txt2txt, v1.0.0) and `anthropic/claude` (txt2img, v2.0.0).
+
+    Only read by `list_models` tests, so a single instance is shared across the module.
+    """
+    catalog = ModelCatalog(name="test-catalog")
+    catalog.register_model(single_version_model)
+    catalog.register_model(claude_model)
+    return catalog
+
+
+@pytest.fixture(scope="module")
+def three_model_catalog(
+    single_version_model: Model,
+    large_resource_requirements: ResourceRequirements,
+) -> ModelCatalog:
+    """Catalog with `openai/gpt-4` (txt2txt, v1.0.0), `openai/gpt-3` (txt2txt, v2.0.0) and `anthropic/claude`
+    (txt2img, v1.5.0), so a combined filter has to rule out one model by search text and another by task type.
+
+    Only read by `list_models` tests, so a single instance is shared across the module.
+    """
+    gpt3_version = make_version(
+        id=_GPT3_V2_ID,
+        model_id=_GPT3_ID,
+        value="v2.0.0",
+        checksum=SHA_B,
+        artifact_uri=MODEL2_ARTIFACT_URI,
+        resource_requirements=large_resource_requirements,
+    )
+    claude_version = make_version(
+        id=_CLAUDE_V15_ID,
+        model_id=CLAUDE_ID,
+        value="v1.5.0",
+        checksum=SHA_C,
+        artifact_uri=_URL_MODEL_3,
+        resource_requirements=large_resource_requirements,
+    )
+
+    catalog = ModelCatalog(name="test-catalog")
+    catalog.register_model(single_version_model)
+    catalog.register_model(make_model(id=_GPT3_ID, versions={gpt3_version.id: gpt3_version}))
+    catalog.register_model(
+        make_model(id=CLAUDE_ID, task_type=TaskType.of(_TXT2IMG), versions={claude_version.id: claude_version})
+    )
+    return catalog
 
 
 class TestModelCatalogListModels:
     """Test ModelCatalog list_models method."""
 
-    def test_list_models_without_filter_should_return_all_models(self) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id1 = ModelId(value="openai/gpt-4")
-        version1 = ModelVersion(
-            model_id=model_id1,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model1.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model1 = Model(
-            id=model_id1,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version1.id: version1},
-        )
-
-        model_id2 = ModelId(value="anthropic/claude")
-        version2 = ModelVersion(
-            model_id=model_id2,
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model2.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model2 = Model(
-            id=model_id2,
-            task_type=TaskType(value=TaskTypeEnum.TXT2IMG),
-            versions={version2.id: version2},
-        )
-        catalog.register_model(model1)
-        catalog.register_model(model2)
-
+    @pytest.mark.parametrize(
+        "filter,expected_ids",
+        [
+            (None, frozenset({GPT4_ID, CLAUDE_ID})),
+            (_F_TXT2TXT, frozenset({GPT4_ID})),
+            # Both models use the PYTORCH framework
+            (_F_PYTORCH, frozenset({GPT4_ID, CLAUDE_ID})),
+            (_F_SEARCH_OPENAI, frozenset({GPT4_ID})),
+            (_F_MIN_V2, frozenset({CLAUDE_ID})),
+            (_F_MAX_V1_5, frozenset({GPT4_ID})),
+        ],
+        ids=["no_filter", "task_type", "framework", "search_text", "min_version", "max_version"],
+    )
+    def test_list_models_should_return_models_matching_filter(
+        self,
+        two_model_catalog: ModelCatalog,
+        filter: Optional[ModelFilter],
+        expected_ids: FrozenSet[ModelId],
+    ) -> None:
         # Act
-        result = catalog.list_models()
+        result = two_model_catalog.list_models(filter=filter)
 
         # Assert
-        assert len(result) == 2
-        assert model1 in result
-        assert model2 in result
+        assert len(result) == len(expected_ids)
+        assert _ids(result) == expected_ids
 
     def test_list_models_from_empty_catalog_should_return_empty_list(self) -> None:
         # Arrange
@@ -602,424 +372,48 @@ class TestModelCatalogListModels:
         # Assert
         assert len(result) == 0
 
-    def test_list_models_with_task_type_filter_should_return_filtered_models(
-        self,
-    ) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id1 = ModelId(value="openai/gpt-4")
-        version1 = ModelVersion(
-            model_id=model_id1,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model1.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model1 = Model(
-            id=model_id1,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version1.id: version1},
-        )
-
-        model_id2 = ModelId(value="stable/diffusion")
-        version2 = ModelVersion(
-            model_id=model_id2,
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model2.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model2 = Model(
-            id=model_id2,
-            task_type=TaskType(value=TaskTypeEnum.TXT2IMG),
-            versions={version2.id: version2},
-        )
-        catalog.register_model(model1)
-        catalog.register_model(model2)
-
-        # Act
-        filter: ModelFilter = {"task_type": TaskTypeEnum.TXT2TXT.value}
-        result = catalog.list_models(filter=filter)
-
-        # Assert
-        assert len(result) == 1
-        assert model1 in result
-        assert model2 not in result
-
-    def test_list_models_with_framework_filter_should_return_filtered_models(
-        self,
-    ) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id1 = ModelId(value="openai/gpt-4")
-        version1 = ModelVersion(
-            model_id=model_id1,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model1.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model1 = Model(
-            id=model_id1,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version1.id: version1},
-        )
-
-        model_id2 = ModelId(value="stable/diffusion")
-        version2 = ModelVersion(
-            model_id=model_id2,
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model2.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model2 = Model(
-            id=model_id2,
-            task_type=TaskType(value=TaskTypeEnum.TXT2IMG),
-            versions={version2.id: version2},
-        )
-        catalog.register_model(model1)
-        catalog.register_model(model2)
-
-        # Act
-        filter: ModelFilter = {"framework": FrameworkEnum.PYTORCH.value}
-        result = catalog.list_models(filter=filter)
-
-        # Assert - both models use PYTORCH framework
-        assert len(result) == 2
-        assert model1 in result
-        assert model2 in result
-
-    def test_list_models_with_search_text_filter_should_return_filtered_models(
-        self,
-    ) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id1 = ModelId(value="openai/gpt-4")
-        version1 = ModelVersion(
-            model_id=model_id1,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model1.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model1 = Model(
-            id=model_id1,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version1.id: version1},
-        )
-
-        model_id2 = ModelId(value="anthropic/claude")
-        version2 = ModelVersion(
-            model_id=model_id2,
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model2.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model2 = Model(
-            id=model_id2,
-            task_type=TaskType(value=TaskTypeEnum.TXT2IMG),
-            versions={version2.id: version2},
-        )
-        catalog.register_model(model1)
-        catalog.register_model(model2)
-
-        # Act
-        filter: ModelFilter = {"search_text": "openai"}
-        result = catalog.list_models(filter=filter)
-
-        # Assert
-        assert len(result) == 1
-        assert model1 in result
-        assert model2 not in result
-
-    def test_list_models_with_min_version_filter_should_return_filtered_models(
-        self,
-    ) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id1 = ModelId(value="openai/gpt-4")
-        version1 = ModelVersion(
-            model_id=model_id1,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model1.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model1 = Model(
-            id=model_id1,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version1.id: version1},
-        )
-
-        model_id2 = ModelId(value="anthropic/claude")
-        version2 = ModelVersion(
-            model_id=model_id2,
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model2.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model2 = Model(
-            id=model_id2,
-            task_type=TaskType(value=TaskTypeEnum.TXT2IMG),
-            versions={version2.id: version2},
-        )
-        catalog.register_model(model1)
-        catalog.register_model(model2)
-
-        # Act
-        filter: ModelFilter = {"min_version": "v2.0.0"}
-        result = catalog.list_models(filter=filter)
-
-        # Assert
-        assert len(result) == 1
-        assert model2 in result
-        assert model1 not in result
-
-    def test_list_models_with_max_version_filter_should_return_filtered_models(
+    def test_list_models_with_multiple_filters_should_return_filtered_models(
         self,
+        three_model_catalog: ModelCatalog,
+        single_version_model: Model,
     ) -> None:
-        # Arrange
-        catalog = ModelCatalog(name="test-catalog")
-        model_id1 = ModelId(value="openai/gpt-4")
-        version1 = ModelVersion(
-            model_id=model_id1,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model1.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model1 = Model(
-            id=model_id1,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version1.id: version1},
-        )
-
-        model_id2 = ModelId(value="anthropic/claude")
-        version2 = ModelVersion(
-            model_id=model_id2,
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model2.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model2 = Model(
-            id=model_id2,
-            task_type=TaskType(value=TaskTypeEnum.TXT2IMG),
-            versions={version2.id: version2},
-        )
-        catalog.register_model(model1)
-        catalog.register_model(model2)
-
         # Act
-        filter: ModelFilter = {"max_version": "v1.5.0"}
-        result = catalog.list_models(filter=filter)
+        result = three_model_catalog.list_models(filter=_F_GPT4_TXT2TXT_PYTORCH)
 
         # Assert
         assert len(result) == 1
-        assert model1 in result
-        assert model2 not in result
-
-    def test_list_models_with_multiple_filters_should_return_filtered_models(
+        assert _ids(result) == {single_version_model.id}
+
+    @pytest.mark.parametrize(
+        "filter,expected_count",
+        [(_F_MIN_V2, 1), (_F_MAX_V9, 0)],
+        ids=["min_version", "max_version"],
+    )
+    def test_list_models_should_compare_versions_numerically(
         self,
+        filter: ModelFilter,
+        expected_count: int,
     ) -> None:
         # Arrange
+        # "v10.0.0" sorts before "v2.0.0" as a plain string, so this only passes with numeric comparison
+        version = make_version(id=_GPT4_V10_ID, value="v10.0.0")
         catalog = ModelCatalog(name="test-catalog")
-        model_id1 = ModelId(value="openai/gpt-4")
-        version1 = ModelVersion(
-            model_id=model_id1,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model1.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model1 = Model(
-            id=model_id1,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version1.id: version1},
-        )
-
-        model_id2 = ModelId(value="openai/gpt-3")
-        version2 = ModelVersion(
-            model_id=model_id2,
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model2.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model2 = Model(
-            id=model_id2,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version2.id: version2},
-        )
-
-        model_id3 = ModelId(value="anthropic/claude")
-        version3 = ModelVersion(
-            model_id=model_id3,
-            value="v1.5.0",
-            checksum="sha256:" + "c" * 64,
-            artifact_uri=AnyUrl("https://example.com/model3.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model3 = Model(
-            id=model_id3,
-            task_type=TaskType(value=TaskTypeEnum.TXT2IMG),
-            versions={version3.id: version3},
-        )
-
-        catalog.register_model(model1)
-        catalog.register_model(model2)
-        catalog.register_model(model3)
+        catalog.register_model(make_model(versions={version.id: version}))
 
         # Act
-        filter: ModelFilter = {
-            "task_type": TaskTypeEnum.TXT2TXT.value,
-            "framework": FrameworkEnum.PYTORCH.value,
-            "search_text": "gpt-4",
-        }
         result = catalog.list_models(filter=filter)
 
         # Assert
-        assert len(result) == 1
-        assert model1 in result
-        assert model2 not in result
-        assert model3 not in result
+        assert len(result) == expected_count
 
 
 class TestModelCatalogStringRepresentations:
     """Test ModelCatalog string representations."""
 
-    def test_repr_should_return_detailed_string(self) -> None:
+    def test_repr_should_return_detailed_string(self, single_version_model: Model) -> None:
         # Arrange
         catalog = ModelCatalog(name="test-catalog")
-        model_id = ModelId(value="openai/gpt-4")
-        version = ModelVersion(
-            model_id=model_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model = Model(
-            id=model_id,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version.id: version},
-        )
-        catalog.register_model(model)
+        catalog.register_model(single_version_model)
 
         # Act
         result = repr(catalog)
@@ -1046,35 +440,14 @@ class TestModelCatalogStringRepresentations:
 class TestModelCatalogEquality:
     """Test ModelCatalog equality and hashing."""
 
-    def test_model_catalogs_with_same_id_name_models_should_be_equal(self) -> None:
+    def test_model_catalogs_with_same_id_name_models_should_be_equal(self, single_version_model: Model) -> None:
         # Arrange
-        model_id = ModelId(value="openai/gpt-4")
-        version = ModelVersion(
-            model_id=model_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model = Model(
-            id=model_id,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version.id: version},
-        )
-
         catalog1 = ModelCatalog(name="test-catalog")
-        catalog1.register_model(model)
+        catalog1.register_model(single_version_model)
 
-        # Create catalog2 with same ID and content
-        catalog2 = catalog1.model_copy(deep=True)
+        # Create catalog2 with same ID and content; a fresh `models` dict sharing the registered Model instances
+        # is enough because neither catalog is mutated afterwards
+        catalog2 = catalog1.model_copy(update={"models": dict(catalog1.models)})
 
         # Act & Assert
         assert catalog1 == catalog2
@@ -1106,39 +479,29 @@ class TestModelCatalogEquality:
         # Act & Assert
         assert hash(catalog) is not None
 
-    def test_model_catalogs_with_same_content_should_have_same_hash(self) -> None:
+    def test_model_catalogs_with_same_content_should_have_same_hash(self, single_version_model: Model) -> None:
         # Arrange
-        model_id = ModelId(value="openai/gpt-4")
-        version = ModelVersion(
-            model_id=model_id,
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        model = Model(
-            id=model_id,
-            task_type=TaskType(value=TaskTypeEnum.TXT2TXT),
-            versions={version.id: version},
-        )
-
         catalog1 = ModelCatalog(name="test-catalog")
-        catalog1.register_model(model)
+        catalog1.register_model(single_version_model)
 
-        # Create catalog2 with same content
-        catalog2 = catalog1.model_copy(deep=True)
+        # Create catalog2 with same content; a fresh `models` dict sharing the registered Model instances
+        # is enough because neither catalog is mutated afterwards
+        catalog2 = catalog1.model_copy(update={"models": dict(catalog1.models)})
 
         # Act & Assert
         assert hash(catalog1) == hash(catalog2)
 
+    def test_model_catalog_hash_should_be_stable_after_registering_model(self, single_version_model: Model) -> None:
+        # Arrange
+        catalog = ModelCatalog(name="test-catalog")
+        original_hash = hash(catalog)
+
+        # Act
+        catalog.register_model(single_version_model)
+
+        # Assert
+        assert hash(catalog) == original_hash
+
     def test_model_catalog_can_be_used_in_set(self) -> None:
         # Arrange
         catalog1 = ModelCatalog(name="catalog1")
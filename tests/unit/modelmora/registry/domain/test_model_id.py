@@ -21,38 +21,41 @@ class TestModelIdInitialization:
         # Assert
         assert model_id.value == "my-org_123/my-model_v2"
 
-    def test_create_model_id_without_slash_should_raise_error(self) -> None:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "invalidmodelid",
+            "org/repo/extra",
+            "/repo",
+            "org/",
+            "org@invalid/repo#test",
+            "a" * 150 + "/" + "b" * 150,  # Over 200 characters
+        ],
+        ids=[
+            "without_slash",
+            "multiple_slashes",
+            "empty_org",
+            "empty_repo",
+            "special_characters",
+            "exceeding_max_length",
+        ],
+    )
+    def test_create_model_id_with_invalid_value_should_raise_error(self, value: str) -> None:
         # Arrange & Act & Assert
         with pytest.raises(ValidationError):
-            ModelId(value="invalidmodelid")
+            ModelId(value=value)
 
-    def test_create_model_id_with_multiple_slashes_should_raise_error(self) -> None:
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            ModelId(value="org/repo/extra")
-
-    def test_create_model_id_with_empty_org_should_raise_error(self) -> None:
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            ModelId(value="/repo")
+    def test_from_strings_should_create_model_ids(self) -> None:
+        # Act
+        model_ids = ModelId.from_strings(["openai/gpt-4", "anthropic/claude"])
 
-    def test_create_model_id_with_empty_repo_should_raise_error(self) -> None:
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            ModelId(value="org/")
+        # Assert
+        assert model_ids == [ModelId(value="openai/gpt-4"), ModelId(value="anthropic/claude")]
 
-    def test_create_model_id_with_special_characters_should_raise_error(self) -> None:
+    def test_from_strings_with_invalid_value_should_raise_error(self) -> None:
         # Arrange & Act & Assert
         with pytest.raises(ValidationError):
-            ModelId(value="org@invalid/repo#test")
-
-    def test_create_model_id_exceeding_max_length_should_raise_error(self) -> None:
-        # Arrange
-        long_value = "a" * 150 + "/" + "b" * 150  # Over 200 characters
-
-        # Act & Assert
-        with pytest.raises(ValidationError):
-            ModelId(value=long_value)
+            ModelId.from_strings(["openai/gpt-4", "invalidmodelid"])
 
 
 class TestModelIdProperties:
@@ -86,6 +89,18 @@ class TestModelIdProperties:
         assert model_id.org == "meta-ai_v2"
         assert model_id.repo == "llama-3_70B"
 
+    def test_org_and_repo_of_copy_with_new_value_should_follow_new_value(self) -> None:
+        # Arrange
+        model_id = ModelId(value="openai/gpt-4")
+        _ = model_id.org, model_id.repo
+
+        # Act
+        copied = model_id.model_copy(update={"value": "anthropic/claude"})
+
+        # Assert
+        assert copied.org == "anthropic"
+        assert copied.repo == "claude"
+
 
 class TestModelIdStringRepresentations:
     """Test ModelId string representations."""
@@ -114,21 +129,19 @@ class TestModelIdStringRepresentations:
 class TestModelIdEquality:
     """Test ModelId equality and hashing."""
 
-    def test_equal_model_ids_with_same_value_should_be_equal(self) -> None:
-        # Arrange
-        model_id1 = ModelId(value="openai/gpt-4")
-        model_id2 = ModelId(value="openai/gpt-4")
-
-        # Act & Assert
-        assert model_id1 == model_id2
-
-    def test_different_model_ids_should_not_be_equal(self) -> None:
+    @pytest.mark.parametrize(
+        "other_value,expected_equal",
+        [("openai/gpt-4", True), ("anthropic/claude", False)],
+        ids=["same_value", "different_value"],
+    )
+    def test_model_ids_should_compare_and_hash_by_value(self, other_value: str, expected_equal: bool) -> None:
         # Arrange
         model_id1 = ModelId(value="openai/gpt-4")
-        model_id2 = ModelId(value="anthropic/claude")
+        model_id2 = ModelId(value=other_value)
 
         # Act & Assert
-        assert model_id1 != model_id2
+        assert (model_id1 == model_id2) is expected_equal
+        assert (hash(model_id1) == hash(model_id2)) is expected_equal
 
     def test_model_id_equality_with_non_model_id_should_return_not_implemented(
         self,
@@ -142,27 +155,9 @@ class TestModelIdEquality:
         # Assert
         assert result == NotImplemented
 
-    def test_equal_model_ids_should_have_equal_hashes(self) -> None:
-        # Arrange
-        model_id1 = ModelId(value="openai/gpt-4")
-        model_id2 = ModelId(value="openai/gpt-4")
-
-        # Act & Assert
-        assert hash(model_id1) == hash(model_id2)
-
-    def test_different_model_ids_should_have_different_hashes(self) -> None:
-        # Arrange
-        model_id1 = ModelId(value="openai/gpt-4")
-        model_id2 = ModelId(value="anthropic/claude")
-
-        # Act & Assert
-        assert hash(model_id1) != hash(model_id2)
-
     def test_model_id_can_be_used_in_set(self) -> None:
         # Arrange
-        model_id1 = ModelId(value="openai/gpt-4")
-        model_id2 = ModelId(value="openai/gpt-4")
-        model_id3 = ModelId(value="anthropic/claude")
+        model_id1, model_id2, model_id3 = ModelId.from_strings(["openai/gpt-4", "openai/gpt-4", "anthropic/claude"])
 
         # Act
         model_set = {model_id1, model_id2, model_id3}
@@ -172,9 +167,7 @@ class TestModelIdEquality:
 
     def test_model_id_can_be_used_as_dict_key(self) -> None:
         # Arrange
-        model_id1 = ModelId(value="openai/gpt-4")
-        model_id2 = ModelId(value="openai/gpt-4")
-        model_id3 = ModelId(value="anthropic/claude")
+        model_id1, model_id2, model_id3 = ModelId.from_strings(["openai/gpt-4", "openai/gpt-4", "anthropic/claude"])
 
         # Act
         model_dict = {model_id1: "first", model_id2: "second", model_id3: "third"}
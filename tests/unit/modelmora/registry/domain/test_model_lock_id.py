@@ -1,9 +1,17 @@
+from typing import List
+
 import pytest
 
 from modelmora.registry.domain.model_lock_id import ModelLockId
 from modelmora.shared.identifiers import StringId
 
 
+@pytest.fixture(scope="module")
+def lock_id_pool() -> List[ModelLockId]:
+    """Distinct pre-generated IDs for tests that only need some IDs, not the act of generating them."""
+    return [ModelLockId.generate() for _ in range(2)]
+
+
 class TestModelLockId:
     """Test ModelLockId identifier."""
 
@@ -17,24 +25,19 @@ class TestModelLockId:
 
     def test_generate_should_create_unique_ids(self) -> None:
         # Arrange & Act
-        id1 = ModelLockId.generate()
-        id2 = ModelLockId.generate()
+        ids = {ModelLockId.generate() for _ in range(1024)}
 
         # Assert
-        assert id1 != id2
-        assert str(id1) != str(id2)
-
-    def test_model_lock_id_should_be_hashable(self) -> None:
-        # Arrange
-        lock_id = ModelLockId.generate()
+        assert len(ids) == 1024
+        assert len({str(lock_id) for lock_id in ids}) == 1024
 
+    def test_model_lock_id_should_be_hashable(self, lock_id_pool: List[ModelLockId]) -> None:
         # Act & Assert
-        assert hash(lock_id) is not None
+        assert hash(lock_id_pool[0]) is not None
 
-    def test_model_lock_id_can_be_used_in_set(self) -> None:
+    def test_model_lock_id_can_be_used_in_set(self, lock_id_pool: List[ModelLockId]) -> None:
         # Arrange
-        id1 = ModelLockId.generate()
-        id2 = ModelLockId.generate()
+        id1, id2 = lock_id_pool[:2]
 
         # Act
         id_set = {id1, id2, id1}
@@ -42,10 +45,9 @@ class TestModelLockId:
         # Assert
         assert len(id_set) == 2
 
-    def test_model_lock_id_can_be_used_as_dict_key(self) -> None:
+    def test_model_lock_id_can_be_used_as_dict_key(self, lock_id_pool: List[ModelLockId]) -> None:
         # Arrange
-        lock_id1 = ModelLockId.generate()
-        lock_id2 = ModelLockId.generate()
+        lock_id1, lock_id2 = lock_id_pool[:2]
 
         # Act
         lock_dict = {lock_id1: "Lock 1", lock_id2: "Lock 2"}
@@ -1,33 +1,21 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+
 import pytest
 from pydantic import AnyUrl, ValidationError
 
 from modelmora.registry.domain.framework_enum import FrameworkEnum
-from modelmora.registry.domain.model_id import ModelId
-from modelmora.registry.domain.model_version import ModelVersion
-from modelmora.registry.domain.resource_requirements import ResourceRequirements
+from modelmora.registry.domain.model_version import ModelVersion, semantic_version_key
+from tests.unit.modelmora.registry.domain._factories import SHA_B, make_version
 
 
 class TestModelVersionInitialization:
     """Test ModelVersion initialization and validation."""
 
-    def test_create_model_version_with_valid_values_should_succeed(self) -> None:
+    def test_create_model_version_with_valid_values_should_succeed(
+        self, build_version: Callable[..., ModelVersion]
+    ) -> None:
         # Arrange & Act
-        version = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-            framework_version="2.4.1",
-        )
+        version = build_version(framework_version="2.4.1")
 
         # Assert
         assert version.model_id.value == "openai/gpt-4"
@@ -36,174 +24,85 @@ class TestModelVersionInitialization:
         assert version.framework_version == "2.4.1"
         assert version.metadata is None
 
-    def test_create_model_version_with_metadata_should_succeed(self) -> None:
+    def test_create_model_version_with_metadata_should_succeed(
+        self, build_version: Callable[..., ModelVersion]
+    ) -> None:
         # Arrange & Act
         metadata = {"author": "OpenAI", "license": "MIT"}
-        version = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-            metadata=metadata,
-        )
+        version = build_version(metadata=metadata)
 
         # Assert
         assert version.metadata == metadata
 
-    def test_create_model_version_with_branch_name_should_succeed(self) -> None:
+    def test_create_model_version_with_branch_name_should_succeed(
+        self, build_version: Callable[..., ModelVersion]
+    ) -> None:
         # Arrange & Act
-        version = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="development",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
+        version = build_version(value="development", checksum=SHA_B)
 
         # Assert
         assert version.value == "development"
 
-    def test_create_model_version_with_invalid_version_pattern_should_raise_error(
-        self,
+    @pytest.mark.parametrize(
+        "field,bad_value",
+        [
+            ("value", "invalid version!"),
+            ("framework_version", "invalid.version.x"),
+            ("artifact_uri", "not a url"),
+        ],
+        ids=["invalid_version_pattern", "invalid_framework_version", "invalid_string_uri"],
+    )
+    def test_create_model_version_with_invalid_field_should_raise_error(
+        self, build_version: Callable[..., ModelVersion], field: str, bad_value: str
     ) -> None:
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            ModelVersion(
-                model_id=ModelId(value="openai/gpt-4"),
-                value="invalid version!",
-                checksum="sha256:" + "a" * 64,
-                artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-                resource_requirements=ResourceRequirements(
-                    memory_mb=1024,
-                    gpu_vram_mb=2048,
-                    cpu_threads=4,
-                    gpu_count=1,
-                    min_memory_mb=512,
-                    disk_space_mb=5000,
-                ),
-                framework=FrameworkEnum.PYTORCH,
-            )
-
-    def test_create_model_version_with_invalid_framework_version_should_raise_error(
-        self,
+        with pytest.raises(ValidationError, match=field):
+            build_version(**{field: bad_value})
+
+    def test_create_model_versions_with_same_string_uri_should_share_parsed_url(
+        self, build_version: Callable[..., ModelVersion]
     ) -> None:
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            ModelVersion(
-                model_id=ModelId(value="openai/gpt-4"),
-                value="v1.0.0",
-                checksum="sha256:" + "a" * 64,
-                artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-                resource_requirements=ResourceRequirements(
-                    memory_mb=1024,
-                    gpu_vram_mb=2048,
-                    cpu_threads=4,
-                    gpu_count=1,
-                    min_memory_mb=512,
-                    disk_space_mb=5000,
-                ),
-                framework=FrameworkEnum.PYTORCH,
-                framework_version="invalid.version.x",
-            )
+        # Arrange & Act
+        versions = [
+            build_version(value=value, artifact_uri="https://example.com/model.tar.gz")
+            for value in ("v1.0.0", "v2.0.0")
+        ]
+
+        # Assert
+        assert isinstance(versions[0].artifact_uri, AnyUrl)
+        assert versions[0].artifact_uri is versions[1].artifact_uri
 
 
 class TestModelVersionUpdateMetadata:
     """Test ModelVersion update_metadata method."""
 
-    def test_update_metadata_on_version_without_metadata_should_create_metadata(
+    @pytest.mark.parametrize(
+        "initial,update,expected",
+        [
+            (None, {"author": "OpenAI"}, {"author": "OpenAI"}),
+            (
+                {"author": "OpenAI"},
+                {"license": "MIT", "version": "1.0"},
+                {"author": "OpenAI", "license": "MIT", "version": "1.0"},
+            ),
+            ({"author": "OpenAI", "version": "1.0"}, {"version": "2.0"}, {"author": "OpenAI", "version": "2.0"}),
+        ],
+        ids=["creates_missing_metadata", "merges_with_existing_metadata", "overwrites_existing_keys"],
+    )
+    def test_update_metadata_should_merge_into_existing_metadata(
         self,
+        initial: Optional[Dict[str, Any]],
+        update: Dict[str, Any],
+        expected: Dict[str, Any],
     ) -> None:
         # Arrange
-        version = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-
-        # Act
-        version.update_metadata({"author": "OpenAI"})
-
-        # Assert
-        assert version.metadata == {"author": "OpenAI"}
-
-    def test_update_metadata_on_version_with_existing_metadata_should_merge(
-        self,
-    ) -> None:
-        # Arrange
-        version = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-            metadata={"author": "OpenAI"},
-        )
-
-        # Act
-        version.update_metadata({"license": "MIT", "version": "1.0"})
-
-        # Assert
-        assert version.metadata == {"author": "OpenAI", "license": "MIT", "version": "1.0"}
-
-    def test_update_metadata_should_overwrite_existing_keys(self) -> None:
-        # Arrange
-        version = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-            metadata={"author": "OpenAI", "version": "1.0"},
-        )
+        version = make_version(metadata=initial)
 
         # Act
-        version.update_metadata({"version": "2.0"})
+        version.update_metadata(update)
 
         # Assert
-        assert version.metadata["version"] == "2.0"
+        assert version.metadata == expected
 
 
 class TestModelVersionStringRepresentations:
@@ -211,21 +110,7 @@ class TestModelVersionStringRepresentations:
 
     def test_repr_should_return_detailed_string(self) -> None:
         # Arrange
-        version = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
+        version = make_version()
 
         # Act
         result = repr(version)
@@ -237,21 +122,7 @@ class TestModelVersionStringRepresentations:
 
     def test_str_should_return_readable_string(self) -> None:
         # Arrange
-        version = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
+        version = make_version()
 
         # Act
         result = str(version)
@@ -265,36 +136,8 @@ class TestModelVersionEquality:
 
     def test_equal_model_versions_with_same_values_should_have_different_ids(self) -> None:
         # Arrange
-        version1 = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        version2 = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
+        version1 = make_version()
+        version2 = make_version()
 
         # Act & Assert
         # IDs are generated uniquely, so they won't be equal even with same content
@@ -302,61 +145,20 @@ class TestModelVersionEquality:
         # Since IDs differ and equality checks ID, they won't be equal
         assert version1 != version2
 
-    def test_different_model_versions_should_not_be_equal(self) -> None:
+    def test_different_model_versions_should_not_be_equal(
+        self, version_pair: Tuple[ModelVersion, ModelVersion]
+    ) -> None:
         # Arrange
-        version1 = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        version2 = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/other.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
+        version1, version2 = version_pair
 
         # Act & Assert
         assert version1 != version2
 
     def test_model_version_equality_with_non_version_should_return_not_implemented(
-        self,
+        self, version_pair: Tuple[ModelVersion, ModelVersion]
     ) -> None:
         # Arrange
-        version = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
+        version, _ = version_pair
 
         # Act
         result = version.__eq__("not a version")
@@ -364,59 +166,28 @@ class TestModelVersionEquality:
         # Assert
         assert result == NotImplemented
 
-    def test_model_version_should_be_hashable(self) -> None:
+    def test_model_version_should_be_hashable(self, version_pair: Tuple[ModelVersion, ModelVersion]) -> None:
         # Arrange
-        version = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
+        version, _ = version_pair
 
         # Act & Assert
         assert hash(version) is not None
 
-    def test_model_version_can_be_used_in_set(self) -> None:
+    def test_model_version_hash_should_be_stable_after_metadata_update(self) -> None:
         # Arrange
-        version1 = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        version2 = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/other.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
+        version = make_version()
+        original_hash = hash(version)
+
+        # Act
+        # List values are unhashable, so this also checks that metadata no longer feeds the hash
+        version.update_metadata({"tags": ["chat", "instruct"]})
+
+        # Assert
+        assert hash(version) == original_hash
+
+    def test_model_version_can_be_used_in_set(self, version_pair: Tuple[ModelVersion, ModelVersion]) -> None:
+        # Arrange
+        version1, version2 = version_pair
 
         # Act
         version_set = {version1, version2, version1}
@@ -424,38 +195,9 @@ class TestModelVersionEquality:
         # Assert
         assert len(version_set) == 2
 
-    def test_model_version_can_be_used_as_dict_key(self) -> None:
+    def test_model_version_can_be_used_as_dict_key(self, version_pair: Tuple[ModelVersion, ModelVersion]) -> None:
         # Arrange
-        version1 = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v1.0.0",
-            checksum="sha256:" + "a" * 64,
-            artifact_uri=AnyUrl("https://example.com/model.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=1024,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
-        version2 = ModelVersion(
-            model_id=ModelId(value="openai/gpt-4"),
-            value="v2.0.0",
-            checksum="sha256:" + "b" * 64,
-            artifact_uri=AnyUrl("https://example.com/other.tar.gz"),
-            resource_requirements=ResourceRequirements(
-                memory_mb=2048,
-                gpu_vram_mb=4096,
-                cpu_threads=8,
-                gpu_count=2,
-                min_memory_mb=1024,
-                disk_space_mb=10000,
-            ),
-            framework=FrameworkEnum.PYTORCH,
-        )
+        version1, version2 = version_pair
 
         # Act
         version_dict = {version1: "First Version", version2: "Second Version"}
@@ -463,3 +205,22 @@ class TestModelVersionEquality:
         # Assert
         assert version_dict[version1] == "First Version"
         assert version_dict[version2] == "Second Version"
+
+
+class TestSemanticVersionKey:
+    """Test semantic_version_key ordering."""
+
+    @pytest.mark.parametrize(
+        "lower,higher",
+        [
+            ("v9.0.0", "v10.0.0"),
+            ("v1.2.3", "v1.10.0"),
+            ("v1.0.9", "v1.0.10"),
+            ("development", "v0.0.1"),
+            ("v1", "v0.0.0"),
+        ],
+        ids=["major", "minor", "patch", "branch_before_semantic", "incomplete_is_branch"],
+    )
+    def test_semantic_version_key_should_order_numerically(self, lower: str, higher: str) -> None:
+        # Act & Assert
+        assert semantic_version_key(lower) < semantic_version_key(higher)
@@ -1,8 +1,35 @@
+from typing import Tuple
+
 import pytest
 from pydantic import ValidationError
 
+from modelmora.registry.domain.resource_capacity import ResourceCapacity
 from modelmora.registry.domain.resource_requirements import ResourceRequirements
 
+# Capacities matching the base requirements exactly and with room to spare; fits_in only reads them.
+_CAP_EXACT: ResourceCapacity = {
+    "memory_mb": 1024,
+    "gpu_vram_mb": 2048,
+    "cpu_threads": 4,
+    "gpu_count": 1,
+    "disk_space_mb": 5000,
+}
+_CAP_LARGE: ResourceCapacity = {
+    "memory_mb": 2048,
+    "gpu_vram_mb": 4096,
+    "cpu_threads": 8,
+    "gpu_count": 2,
+    "disk_space_mb": 10000,
+}
+
+
+@pytest.fixture(scope="module")
+def equal_requirements_pair(
+    base_resource_requirements: ResourceRequirements,
+) -> Tuple[ResourceRequirements, ResourceRequirements]:
+    """Two distinct instances with the same values, so equality is not just identity."""
+    return base_resource_requirements, ResourceRequirements(**base_resource_requirements.model_dump())
+
 
 class TestResourceRequirementsInitialization:
     """Test ResourceRequirements initialization and validation."""
@@ -46,18 +73,14 @@ class TestResourceRequirementsInitialization:
         assert requirements.gpu_vram_mb == 0
 
     def test_create_resource_requirements_with_negative_memory_should_raise_error(
-        self,
+        self, base_resource_requirements: ResourceRequirements
     ) -> None:
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            ResourceRequirements(
-                memory_mb=-1,
-                gpu_vram_mb=2048,
-                cpu_threads=4,
-                gpu_count=1,
-                min_memory_mb=512,
-                disk_space_mb=5000,
-            )
+        # Arrange
+        fields = {**base_resource_requirements.model_dump(), "memory_mb": -1}
+
+        # Act & Assert
+        with pytest.raises(ValidationError, match="memory_mb"):
+            ResourceRequirements(**fields)
 
     def test_create_resource_requirements_without_required_fields_should_raise_error(
         self,
@@ -70,16 +93,9 @@ class TestResourceRequirementsInitialization:
 class TestResourceRequirementsStringRepresentation:
     """Test ResourceRequirements string representation."""
 
-    def test_repr_should_return_detailed_string(self) -> None:
+    def test_repr_should_return_detailed_string(self, base_resource_requirements: ResourceRequirements) -> None:
         # Arrange
-        requirements = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
+        requirements = base_resource_requirements
 
         # Act
         result = repr(requirements)
@@ -98,63 +114,29 @@ class TestResourceRequirementsEquality:
     """Test ResourceRequirements equality and hashing."""
 
     def test_equal_resource_requirements_with_same_values_should_be_equal(
-        self,
+        self, equal_requirements_pair: Tuple[ResourceRequirements, ResourceRequirements]
     ) -> None:
         # Arrange
-        req1 = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
-        req2 = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
+        req1, req2 = equal_requirements_pair
 
         # Act & Assert
         assert req1 == req2
 
-    def test_different_resource_requirements_should_not_be_equal(self) -> None:
+    def test_different_resource_requirements_should_not_be_equal(
+        self, base_resource_requirements: ResourceRequirements, large_resource_requirements: ResourceRequirements
+    ) -> None:
         # Arrange
-        req1 = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
-        req2 = ResourceRequirements(
-            memory_mb=2048,
-            gpu_vram_mb=4096,
-            cpu_threads=8,
-            gpu_count=2,
-            min_memory_mb=1024,
-            disk_space_mb=10000,
-        )
+        req1 = base_resource_requirements
+        req2 = large_resource_requirements
 
         # Act & Assert
         assert req1 != req2
 
     def test_resource_requirements_equality_with_non_resource_requirements_should_return_not_implemented(
-        self,
+        self, base_resource_requirements: ResourceRequirements
     ) -> None:
         # Arrange
-        requirements = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
+        requirements = base_resource_requirements
 
         # Act
         result = requirements.__eq__("not requirements")
@@ -162,48 +144,21 @@ class TestResourceRequirementsEquality:
         # Assert
         assert result == NotImplemented
 
-    def test_equal_resource_requirements_should_have_equal_hashes(self) -> None:
+    def test_equal_resource_requirements_should_have_equal_hashes(
+        self, equal_requirements_pair: Tuple[ResourceRequirements, ResourceRequirements]
+    ) -> None:
         # Arrange
-        req1 = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
-        req2 = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
+        req1, req2 = equal_requirements_pair
 
         # Act & Assert
         assert hash(req1) == hash(req2)
 
     def test_different_resource_requirements_should_have_different_hashes(
-        self,
+        self, base_resource_requirements: ResourceRequirements, large_resource_requirements: ResourceRequirements
     ) -> None:
         # Arrange
-        req1 = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
-        req2 = ResourceRequirements(
-            memory_mb=2048,
-            gpu_vram_mb=4096,
-            cpu_threads=8,
-            gpu_count=2,
-            min_memory_mb=1024,
-            disk_space_mb=10000,
-        )
+        req1 = base_resource_requirements
+        req2 = large_resource_requirements
 
         # Act & Assert
         assert hash(req1) != hash(req2)
@@ -212,23 +167,12 @@ class TestResourceRequirementsEquality:
 class TestResourceRequirementsFitsIn:
     """Test ResourceRequirements fits_in method."""
 
-    def test_fits_in_with_exact_capacity_should_return_true(self) -> None:
+    def test_fits_in_with_exact_capacity_should_return_true(
+        self, base_resource_requirements: ResourceRequirements
+    ) -> None:
         # Arrange
-        requirements = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
-        capacity = {
-            "memory_mb": 1024,
-            "gpu_vram_mb": 2048,
-            "cpu_threads": 4,
-            "gpu_count": 1,
-            "disk_space_mb": 5000,
-        }
+        requirements = base_resource_requirements
+        capacity = _CAP_EXACT
 
         # Act
         result = requirements.fits_in(capacity)
@@ -236,23 +180,12 @@ class TestResourceRequirementsFitsIn:
         # Assert
         assert result is True
 
-    def test_fits_in_with_larger_capacity_should_return_true(self) -> None:
+    def test_fits_in_with_larger_capacity_should_return_true(
+        self, base_resource_requirements: ResourceRequirements
+    ) -> None:
         # Arrange
-        requirements = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
-        capacity = {
-            "memory_mb": 2048,
-            "gpu_vram_mb": 4096,
-            "cpu_threads": 8,
-            "gpu_count": 2,
-            "disk_space_mb": 10000,
-        }
+        requirements = base_resource_requirements
+        capacity = _CAP_LARGE
 
         # Act
         result = requirements.fits_in(capacity)
@@ -260,119 +193,30 @@ class TestResourceRequirementsFitsIn:
         # Assert
         assert result is True
 
-    def test_fits_in_with_insufficient_memory_should_return_false(self) -> None:
-        # Arrange
-        requirements = ResourceRequirements(
-            memory_mb=2048,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
-        capacity = {
-            "memory_mb": 1024,
-            "gpu_vram_mb": 4096,
-            "cpu_threads": 8,
-            "gpu_count": 2,
-            "disk_space_mb": 10000,
-        }
-
-        # Act
-        result = requirements.fits_in(capacity)
-
-        # Assert
-        assert result is False
-
-    def test_fits_in_with_insufficient_gpu_vram_should_return_false(self) -> None:
-        # Arrange
-        requirements = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=4096,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
-        capacity = {
-            "memory_mb": 2048,
-            "gpu_vram_mb": 2048,
-            "cpu_threads": 8,
-            "gpu_count": 2,
-            "disk_space_mb": 10000,
-        }
-
-        # Act
-        result = requirements.fits_in(capacity)
-
-        # Assert
-        assert result is False
-
-    def test_fits_in_with_insufficient_cpu_threads_should_return_false(self) -> None:
-        # Arrange
-        requirements = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=8,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
-        capacity = {
-            "memory_mb": 2048,
-            "gpu_vram_mb": 4096,
-            "cpu_threads": 4,
-            "gpu_count": 2,
-            "disk_space_mb": 10000,
-        }
-
-        # Act
-        result = requirements.fits_in(capacity)
-
-        # Assert
-        assert result is False
-
-    def test_fits_in_with_insufficient_gpu_count_should_return_false(self) -> None:
-        # Arrange
-        requirements = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=2,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
-        capacity = {
-            "memory_mb": 2048,
-            "gpu_vram_mb": 4096,
-            "cpu_threads": 8,
-            "gpu_count": 1,
-            "disk_space_mb": 10000,
-        }
-
-        # Act
-        result = requirements.fits_in(capacity)
-
-        # Assert
-        assert result is False
-
-    def test_fits_in_with_insufficient_disk_space_should_return_false(self) -> None:
+    @pytest.mark.parametrize(
+        "field,required,available",
+        [
+            ("memory_mb", 2048, 1024),
+            ("gpu_vram_mb", 4096, 2048),
+            ("cpu_threads", 8, 4),
+            ("gpu_count", 2, 1),
+            ("disk_space_mb", 10000, 5000),
+        ],
+        ids=["memory", "gpu_vram", "cpu_threads", "gpu_count", "disk_space"],
+    )
+    def test_fits_in_with_insufficient_resource_should_return_false(
+        self,
+        base_resource_requirements: ResourceRequirements,
+        field: str,
+        required: int,
+        available: int,
+    ) -> None:
         # Arrange
-        requirements = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=10000,
+        # Only fits_in is under test, so skip re-validating the trusted literal
+        requirements = ResourceRequirements.model_construct(
+            **{**base_resource_requirements.model_dump(), field: required}
         )
-        capacity = {
-            "memory_mb": 2048,
-            "gpu_vram_mb": 4096,
-            "cpu_threads": 8,
-            "gpu_count": 2,
-            "disk_space_mb": 5000,
-        }
+        capacity = {**_CAP_LARGE, field: available}
 
         # Act
         result = requirements.fits_in(capacity)
@@ -384,17 +228,14 @@ class TestResourceRequirementsFitsIn:
 class TestResourceRequirementsImmutability:
     """Test ResourceRequirements immutability (frozen=True)."""
 
-    def test_modify_resource_requirements_field_should_raise_error(self) -> None:
+    def test_modify_resource_requirements_field_should_raise_error(
+        self, base_resource_requirements: ResourceRequirements
+    ) -> None:
         # Arrange
-        requirements = ResourceRequirements(
-            memory_mb=1024,
-            gpu_vram_mb=2048,
-            cpu_threads=4,
-            gpu_count=1,
-            min_memory_mb=512,
-            disk_space_mb=5000,
-        )
+        requirements = base_resource_requirements
 
         # Act & Assert
+        # The model is frozen, so the assignment is rejected before the shared instance changes
         with pytest.raises(ValidationError):
             requirements.memory_mb = 2048
+        assert requirements.memory_mb == 1024